@@ -1,21 +1,66 @@
-from typing import Any, Iterator, Sequence, Union, cast
+import threading
+from typing import Any, List, Sequence, Union, cast
 
+import pyarrow as pa
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 
 import dlt
+from dlt.common import json
 from dlt.common.configuration.specs import (
     GcpOAuthCredentials,
     GcpServiceAccountCredentials,
 )
 from dlt.common.typing import DictStrAny, StrAny
+from dlt.common.utils import digest256
+
+
+class DltJsonModel(JsonModel):
+    def deserialize(self, content: bytes) -> Any:
+        # parse responses with dlt json which is backed by orjson
+        return json.loadb(content)
+
+
+# service objects are expensive to build, but they share an http connection that is not thread safe
+# so keep the last service built in each thread
+_SHEETS_SERVICE = threading.local()
 
 
 def _initialize_sheets(
     credentials: Union[GcpOAuthCredentials, GcpServiceAccountCredentials]
 ) -> Any:
-    # Build the service object.
-    service = build("sheets", "v4", credentials=credentials.to_native_credentials())
-    return service
+    # identify credentials by digest so the private key is not kept around as a cache key
+    credentials_digest = digest256(credentials.to_native_representation())
+    if getattr(_SHEETS_SERVICE, "credentials_digest", None) != credentials_digest:
+        # Build the service object.
+        _SHEETS_SERVICE.service = build(
+            "sheets",
+            "v4",
+            credentials=credentials.to_native_credentials(),
+            model=DltJsonModel(),
+        )
+        _SHEETS_SERVICE.credentials_digest = credentials_digest
+    return _SHEETS_SERVICE.service
+
+
+def _to_arrow_array(column: List[Any]) -> pa.Array:
+    try:
+        return pa.array(column)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        # column mixes numbers and text or has integers that do not fit in int64, keep all values as text
+        return pa.array([None if v is None else str(v) for v in column], type=pa.string())
+
+
+def _to_column_names(headers: List[Any]) -> List[str]:
+    names: List[str] = []
+    for idx, header in enumerate(headers):
+        # headers may be numbers, blank and merged header cells are returned as ""
+        name = str(header) if header != "" else f"column_{idx + 1}"
+        # arrow tables need unique names, add the column position to repeated headers
+        while name in names:
+            name = f"{name}_{idx + 1}"
+        names.append(name)
+    return names
 
 
 @dlt.source
@@ -28,33 +73,48 @@ def google_spreadsheet(
 ) -> Any:
     sheets = _initialize_sheets(cast(GcpServiceAccountCredentials, credentials))
 
-    def get_sheet(sheet_name: str) -> Iterator[DictStrAny]:
-        # get list of list of typed values
-        result = (
-            sheets.spreadsheets()
-            .values()
-            .get(
-                spreadsheetId=spreadsheet_id,
-                range=sheet_name,
-                # unformatted returns typed values
-                valueRenderOption="UNFORMATTED_VALUE",
-                # will return formatted dates
-                dateTimeRenderOption="FORMATTED_STRING",
-            )
-            .execute()
+    # get list of list of typed values for all the sheets in a single request
+    result = (
+        sheets.spreadsheets()
+        .values()
+        .batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=list(sheet_names),
+            # unformatted returns typed values
+            valueRenderOption="UNFORMATTED_VALUE",
+            # will return formatted dates
+            dateTimeRenderOption="FORMATTED_STRING",
+            # return only the cell values, skip the range metadata
+            fields="valueRanges/values",
         )
+        .execute()
+    )
 
-        # pprint.pprint(result)
-        values = result.get("values")
+    def get_sheet(value_range: DictStrAny) -> pa.Table:
+        # pprint.pprint(value_range)
+        # empty sheets do not return any values
+        values = value_range.get("values") or [[]]
 
-        # yield dicts assuming row 0 contains headers and following rows values and all rows have identical length
-        for v in values[1:]:
-            yield {h: v for h, v in zip(values[0], v)}
+        # return the whole sheet as a single arrow table assuming row 0 contains headers and following rows values
+        # dlt saves arrow tables as parquet files that duckdb copies into the table in a single transaction
+        # NOTE: arrow tables skip dlt normalization: each column gets a single type inferred by arrow and
+        # columns that mix types are loaded as text instead of dlt variant columns, yield dicts if you need those
+        # NOTE: every header cell names a column: blank headers are named by column position, e.g. column_3,
+        # and repeated headers get the position appended, where dicts would keep only the last repeated column
+        headers, rows = _to_column_names(values[0]), values[1:]
+        # the api skips trailing empty cells so short rows are padded with None,
+        # cells past the last header have no column and are dropped
+        # blank cells are returned as "" also in numeric columns so load them as nulls
+        columns = [
+            [row[idx] if idx < len(row) and row[idx] != "" else None for row in rows]
+            for idx in range(len(headers))
+        ]
+        return pa.Table.from_arrays([_to_arrow_array(column) for column in columns], names=headers)
 
-    # create resources from supplied sheet names
+    # create resources from supplied sheet names, value ranges are returned in the order of requested ranges
     return [
-        dlt.resource(get_sheet(name), name=name, write_disposition="replace")
-        for name in sheet_names
+        dlt.resource(get_sheet(value_range), name=name, write_disposition="replace")
+        for name, value_range in zip(sheet_names, result["valueRanges"])
     ]
 
 
@@ -39,7 +39,8 @@ def pytest_configure(config):
     from dlt.common.configuration.specs import run_configuration
     from dlt.common.storages import configuration as storage_configuration
 
-    test_storage_root = "_storage"
+    from tests.utils import TEST_STORAGE_ROOT as test_storage_root
+
     run_configuration.RunConfiguration.config_files_storage_path = os.path.join(
         test_storage_root, "config/"
     )
@@ -1,4 +1,4 @@
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 import pytest
 from itertools import zip_longest
 
@@ -18,27 +18,49 @@ def expect_extracted_file(
     content: str,
     expected_files: int = 1,
 ) -> None:
-    load_ids = storage.extracted_packages.list_packages()
-    gen = (
-        file
-        for load_id in load_ids
-        for file in storage.extracted_packages.list_new_jobs(load_id)
-        if storage.extracted_packages.schema_name(load_id) == schema_name
-        and ParsedLoadJobFileName.parse(file).table_name == table_name
+    _assert_extracted_file(
+        storage, _list_extracted_files(storage), schema_name, table_name, content, expected_files
     )
-    file = next(gen, None)
-    if file is None:
+
+
+def expect_extracted_files(
+    storage: ExtractStorage, expected_content: Sequence[Tuple[str, str, str]]
+) -> None:
+    """Checks (schema_name, table_name, content) of several tables listing the extracted files only once"""
+    extracted_files = _list_extracted_files(storage)
+    for schema_name, table_name, content in expected_content:
+        _assert_extracted_file(storage, extracted_files, schema_name, table_name, content)
+
+
+def _list_extracted_files(storage: ExtractStorage) -> Dict[Tuple[str, str], List[str]]:
+    """Groups new jobs in all extracted packages by (schema_name, table_name)"""
+    extracted_files: Dict[Tuple[str, str], List[str]] = {}
+    for load_id in storage.extracted_packages.list_packages():
+        schema_name = storage.extracted_packages.schema_name(load_id)
+        for file in storage.extracted_packages.list_new_jobs(load_id):
+            table_name = ParsedLoadJobFileName.parse(file).table_name
+            extracted_files.setdefault((schema_name, table_name), []).append(file)
+    return extracted_files
+
+
+def _assert_extracted_file(
+    storage: ExtractStorage,
+    extracted_files: Dict[Tuple[str, str], List[str]],
+    schema_name: str,
+    table_name: str,
+    content: str,
+    expected_files: int = 1,
+) -> None:
+    files = extracted_files.get((schema_name, table_name))
+    if not files:
         raise FileNotFoundError(
             PackageStorage.build_job_file_name(table_name, schema_name, validate_components=False)
         )
-    assert file is not None
-    # get remaining file names
-    remaining_files = list(gen)
     assert (
-        len(remaining_files) + 1 == expected_files
+        len(files) == expected_files
     ), f"Expected {expected_files} files for table {schema_name}:{table_name}"
     # load first file and parse line by line
-    file_content: str = storage.extracted_packages.storage.load(file)
+    file_content: str = storage.extracted_packages.storage.load(files[0])
     if content == "***":
         return
     for line, file_line in zip_longest(content.splitlines(), file_content.splitlines()):
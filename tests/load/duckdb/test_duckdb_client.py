@@ -87,11 +87,9 @@ def test_duckdb_database_path() -> None:
     p = p.drop()
 
     # provide relative path
-    db_path = "_storage/test_quack.duckdb"
+    db_path = os.path.join(TEST_STORAGE_ROOT, "test_quack.duckdb")
     c = resolve_configuration(
-        DuckDbClientConfiguration(
-            dataset_name="test_dataset", credentials="duckdb:///_storage/test_quack.duckdb"
-        )
+        DuckDbClientConfiguration(dataset_name="test_dataset", credentials=f"duckdb:///{db_path}")
     )
     assert c.credentials._conn_str().lower() == os.path.abspath(db_path).lower()
     conn = c.credentials.borrow_conn(read_only=False)
@@ -100,7 +98,7 @@ def test_duckdb_database_path() -> None:
     p = p.drop()
 
     # provide absolute path
-    db_path = os.path.abspath("_storage/abs_test_quack.duckdb")
+    db_path = os.path.abspath(os.path.join(TEST_STORAGE_ROOT, "abs_test_quack.duckdb"))
     c = resolve_configuration(
         DuckDbClientConfiguration(dataset_name="test_dataset", credentials=f"duckdb:///{db_path}")
     )
@@ -112,7 +110,7 @@ def test_duckdb_database_path() -> None:
     p = p.drop()
 
     # set just path as credentials
-    db_path = "_storage/path_test_quack.duckdb"
+    db_path = os.path.join(TEST_STORAGE_ROOT, "path_test_quack.duckdb")
     c = resolve_configuration(
         DuckDbClientConfiguration(dataset_name="test_dataset", credentials=db_path)
     )
@@ -122,7 +120,7 @@ def test_duckdb_database_path() -> None:
     assert os.path.isfile(db_path)
     p = p.drop()
 
-    db_path = os.path.abspath("_storage/abs_path_test_quack.duckdb")
+    db_path = os.path.abspath(os.path.join(TEST_STORAGE_ROOT, "abs_path_test_quack.duckdb"))
     c = resolve_configuration(
         DuckDbClientConfiguration(dataset_name="test_dataset", credentials=db_path)
     )
@@ -144,7 +142,7 @@ def test_duckdb_database_path() -> None:
 
 
 def test_keeps_initial_db_path() -> None:
-    db_path = "_storage/path_test_quack.duckdb"
+    db_path = os.path.join(TEST_STORAGE_ROOT, "path_test_quack.duckdb")
     p = dlt.pipeline(pipeline_name="quack_pipeline", credentials=db_path, destination="duckdb")
     print(p.pipelines_dir)
     with p.sql_client() as conn:
@@ -172,7 +170,7 @@ def test_keeps_initial_db_path() -> None:
 
 
 def test_duckdb_database_delete() -> None:
-    db_path = "_storage/path_test_quack.duckdb"
+    db_path = os.path.join(TEST_STORAGE_ROOT, "path_test_quack.duckdb")
     p = dlt.pipeline(pipeline_name="quack_pipeline", destination=duckdb(credentials=db_path))
     p.run([1, 2, 3], table_name="table", dataset_name="dataset")
     # attach the pipeline
@@ -190,7 +188,7 @@ def test_duckdb_database_delete() -> None:
 
 def test_duck_database_path_delete() -> None:
     # delete path
-    db_folder = "_storage/db_path"
+    db_folder = os.path.join(TEST_STORAGE_ROOT, "db_path")
     os.makedirs(db_folder)
     db_path = f"{db_folder}/path_test_quack.duckdb"
     p = dlt.pipeline(pipeline_name="deep_quack_pipeline", credentials=db_path, destination="duckdb")
@@ -7,7 +7,7 @@ from dlt.common.storages.load_storage import LoadJobInfo
 from dlt.destinations.impl.filesystem.filesystem import FilesystemClient, LoadFilesystemJob
 from dlt.common.schema.typing import LOADS_TABLE_NAME
 
-from tests.utils import skip_if_not_active
+from tests.utils import skip_if_not_active, TEST_STORAGE_ROOT
 
 skip_if_not_active("filesystem")
 
@@ -101,7 +101,7 @@ def test_pipeline_parquet_filesystem_destination() -> None:
     import pyarrow.parquet as pq  # Module is evaluated by other tests
 
     # store locally
-    os.environ["DESTINATION__FILESYSTEM__BUCKET_URL"] = "file://_storage"
+    os.environ["DESTINATION__FILESYSTEM__BUCKET_URL"] = "file://" + TEST_STORAGE_ROOT
     pipeline = dlt.pipeline(
         pipeline_name="parquet_test_" + uniq_id(),
         destination="filesystem",
@@ -637,7 +637,7 @@ def test_many_pipelines_single_dataset(destination_config: DestinationTestConfig
     p = dlt.pipeline(
         pipeline_name="source_1_pipeline", destination="duckdb", dataset_name="shared_dataset"
     )
-    p.run(source_1(), credentials="duckdb:///_storage/test_quack.duckdb")
+    p.run(source_1(), credentials=f"duckdb:///{TEST_STORAGE_ROOT}/test_quack.duckdb")
     counts = load_table_counts(p, *p.default_schema.tables.keys())
     assert counts.items() >= {"gen1": 1, "_dlt_pipeline_state": 1, "_dlt_loads": 1}.items()
     p._wipe_working_folder()
@@ -646,7 +646,7 @@ def test_many_pipelines_single_dataset(destination_config: DestinationTestConfig
     p = dlt.pipeline(
         pipeline_name="source_2_pipeline", destination="duckdb", dataset_name="shared_dataset"
     )
-    p.run(source_2(), credentials="duckdb:///_storage/test_quack.duckdb")
+    p.run(source_2(), credentials=f"duckdb:///{TEST_STORAGE_ROOT}/test_quack.duckdb")
     # table_names = [t["name"] for t in p.default_schema.data_tables()]
     counts = load_table_counts(p, *p.default_schema.tables.keys())
     # gen1: one record comes from source_1, 1 record from source_2
@@ -660,7 +660,7 @@ def test_many_pipelines_single_dataset(destination_config: DestinationTestConfig
         pipeline_name="source_1_pipeline",
         destination="duckdb",
         dataset_name="shared_dataset",
-        credentials="duckdb:///_storage/test_quack.duckdb",
+        credentials=f"duckdb:///{TEST_STORAGE_ROOT}/test_quack.duckdb",
     )
     p.sync_destination()
     # we have our separate state
@@ -677,7 +677,7 @@ def test_many_pipelines_single_dataset(destination_config: DestinationTestConfig
         pipeline_name="source_2_pipeline",
         destination="duckdb",
         dataset_name="shared_dataset",
-        credentials="duckdb:///_storage/test_quack.duckdb",
+        credentials=f"duckdb:///{TEST_STORAGE_ROOT}/test_quack.duckdb",
     )
     p.sync_destination()
     # we have our separate state
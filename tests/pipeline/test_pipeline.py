@@ -1,12 +1,13 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import itertools
 import logging
 import os
 from time import sleep
-from typing import Any, Tuple, cast
+from typing import Any, List, Tuple, cast
 import threading
-from tenacity import retry_if_exception, Retrying, stop_after_attempt
+from tenacity import retry_if_exception, Retrying, stop_after_attempt, wait_none
 
 import pytest
 
@@ -43,7 +44,7 @@ from dlt.pipeline.helpers import retry_load
 from tests.common.utils import TEST_SENTRY_DSN
 from tests.common.configuration.utils import environment
 from tests.utils import TEST_STORAGE_ROOT
-from tests.extract.utils import expect_extracted_file
+from tests.extract.utils import expect_extracted_file, expect_extracted_files
 from tests.pipeline.utils import (
     assert_load_info,
     airtable_emojis,
@@ -52,6 +53,12 @@ from tests.pipeline.utils import (
 )
 
 
+@pytest.fixture
+def dummy_complete() -> dummy:
+    """Dummy destination that completes all jobs immediately"""
+    return dummy(completed_prob=1.0)
+
+
 def test_default_pipeline() -> None:
     p = dlt.pipeline()
     # this is a name of executing test harness or blank pipeline on windows
@@ -381,10 +388,15 @@ def test_extract_multiple_sources() -> None:
     p.config.restore_from_destination = False
     p.extract([s1, s2])
     storage = ExtractStorage(p._normalize_storage_config())
-    expect_extracted_file(storage, "default", "resource_1", json.dumps([1, 2, 3]))
-    expect_extracted_file(storage, "default", "resource_2", json.dumps([3, 4, 5]))
-    expect_extracted_file(storage, "default_2", "resource_3", json.dumps([6, 7, 8]))
-    expect_extracted_file(storage, "default_2", "resource_4", json.dumps([9, 10, 0]))
+    expect_extracted_files(
+        storage,
+        [
+            ("default", "resource_1", json.dumps([1, 2, 3])),
+            ("default", "resource_2", json.dumps([3, 4, 5])),
+            ("default_2", "resource_3", json.dumps([6, 7, 8])),
+            ("default_2", "resource_4", json.dumps([9, 10, 0])),
+        ],
+    )
     assert len(storage.list_files_to_normalize_sorted()) == 4
     p.normalize()
 
@@ -414,11 +426,9 @@ def test_extract_multiple_sources() -> None:
     assert set(p._schema_storage.list_schemas()) == {"default", "default_2"}
 
 
-def test_restore_state_on_dummy() -> None:
-    os.environ["COMPLETED_PROB"] = "1.0"  # make it complete immediately
-
+def test_restore_state_on_dummy(dummy_complete: dummy) -> None:
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy_complete)
     p.config.restore_from_destination = True
     info = p.run([1, 2, 3], table_name="dummy_table")
     print(info)
@@ -427,17 +437,21 @@ def test_restore_state_on_dummy() -> None:
     p.sync_destination()
     assert p.state["_state_version"] == 1
 
-    # wipe out storage
-    p._wipe_working_folder()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    # same pipeline in a fresh pipelines dir, test storage is cleaned up after the test
+    p = dlt.pipeline(
+        pipeline_name=pipeline_name,
+        pipelines_dir=os.path.join(TEST_STORAGE_ROOT, "restored_pipelines"),
+        destination=dummy_complete,
+    )
     assert p.first_run is True
     p.sync_destination()
     assert p.first_run is True
     assert p.state["_state_version"] == 0
 
 
-def test_first_run_flag() -> None:
-    os.environ["COMPLETED_PROB"] = "1.0"  # make it complete immediately
+def test_first_run_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    # attached pipelines restore destination by name so configure it via env
+    monkeypatch.setenv("COMPLETED_PROB", "1.0")  # make it complete immediately
 
     pipeline_name = "pipe_" + uniq_id()
     p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
@@ -479,14 +493,13 @@ def test_has_pending_data_flag() -> None:
     assert p.has_pending_data is False
 
 
-def test_sentry_tracing() -> None:
+def test_sentry_tracing(dummy_complete: dummy) -> None:
     import sentry_sdk
 
-    os.environ["COMPLETED_PROB"] = "1.0"  # make it complete immediately
     os.environ["RUNTIME__SENTRY_DSN"] = TEST_SENTRY_DSN
 
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy_complete)
 
     # def inspect_transaction(ctx):
     #     print(ctx)
@@ -530,7 +543,7 @@ def test_sentry_tracing() -> None:
     assert sentry_sdk.Hub.current.scope.span is None
 
 
-def test_pipeline_state_on_extract_exception() -> None:
+def test_pipeline_state_on_extract_exception(dummy_complete: dummy) -> None:
     pipeline_name = "pipe_" + uniq_id()
     p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
 
@@ -584,7 +597,7 @@ def test_pipeline_state_on_extract_exception() -> None:
 
     # new pipeline
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy_complete)
 
     with pytest.raises(PipelineStepFailed):
         p.run([data_schema_1(), data_schema_2(), data_schema_3()], write_disposition="replace")
@@ -597,7 +610,6 @@ def test_pipeline_state_on_extract_exception() -> None:
     assert len(p._schema_storage.list_schemas()) == 2
     assert p.default_schema_name is None
 
-    os.environ["COMPLETED_PROB"] = "1.0"  # make it complete immediately
     p.run([data_schema_1(), data_schema_2()], write_disposition="replace")
     assert set(p.schema_names) == set(p._schema_storage.list_schemas())
 
@@ -613,11 +625,10 @@ def test_run_with_table_name_exceeding_path_length() -> None:
     assert isinstance(sf_ex.value.__context__, OSError)
 
 
-def test_raise_on_failed_job() -> None:
-    os.environ["FAIL_PROB"] = "1.0"
-    os.environ["RAISE_ON_FAILED_JOBS"] = "true"
+def test_raise_on_failed_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RAISE_ON_FAILED_JOBS", "true")
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy(fail_prob=1.0))
     with pytest.raises(PipelineStepFailed) as py_ex:
         p.run([1, 2, 3], table_name="numbers")
     assert py_ex.value.step == "load"
@@ -631,15 +642,16 @@ def test_raise_on_failed_job() -> None:
     assert load_info is None
 
 
-def test_load_info_raise_on_failed_jobs() -> None:
-    os.environ["COMPLETED_PROB"] = "1.0"
+def test_load_info_raise_on_failed_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    # job outcome is switched below so configure the destination via env
+    monkeypatch.setenv("COMPLETED_PROB", "1.0")
     pipeline_name = "pipe_" + uniq_id()
     p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
     load_info = p.run([1, 2, 3], table_name="numbers")
     assert load_info.has_failed_jobs is False
     load_info.raise_on_failed_jobs()
-    os.environ["COMPLETED_PROB"] = "0.0"
-    os.environ["FAIL_PROB"] = "1.0"
+    monkeypatch.setenv("COMPLETED_PROB", "0.0")
+    monkeypatch.setenv("FAIL_PROB", "1.0")
 
     load_info = p.run([1, 2, 3], table_name="numbers")
     assert load_info.has_failed_jobs is True
@@ -648,7 +660,7 @@ def test_load_info_raise_on_failed_jobs() -> None:
     assert py_ex.value.destination_name == "dummy"
     assert py_ex.value.load_id == load_info.loads_ids[0]
 
-    os.environ["RAISE_ON_FAILED_JOBS"] = "true"
+    monkeypatch.setenv("RAISE_ON_FAILED_JOBS", "true")
     with pytest.raises(PipelineStepFailed) as py_ex_2:
         p.run([1, 2, 3], table_name="numbers")
     load_info = py_ex_2.value.step_info  # type: ignore[assignment]
@@ -659,11 +671,10 @@ def test_load_info_raise_on_failed_jobs() -> None:
     assert py_ex.value.load_id == load_info.loads_ids[0]
 
 
-def test_run_load_pending() -> None:
+def test_run_load_pending(dummy_complete: dummy) -> None:
     # prepare some data and complete load with run
-    os.environ["COMPLETED_PROB"] = "1.0"
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy_complete)
 
     def some_data():
         yield from [1, 2, 3]
@@ -691,10 +702,11 @@ def test_run_load_pending() -> None:
     assert len(load_info.loads_ids) == 1
 
 
-def test_retry_load() -> None:
+def test_retry_load(monkeypatch: pytest.MonkeyPatch) -> None:
     retry_count = 2
 
-    os.environ["COMPLETED_PROB"] = "1.0"
+    # job outcome is switched below so configure the destination via env
+    monkeypatch.setenv("COMPLETED_PROB", "1.0")
     pipeline_name = "pipe_" + uniq_id()
     p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
 
@@ -711,6 +723,7 @@ def test_retry_load() -> None:
 
     for attempt in Retrying(
         stop=stop_after_attempt(3),
+        wait=wait_none(),
         retry=retry_if_exception(retry_load(("load", "extract"))),
         reraise=True,
     ):
@@ -723,19 +736,23 @@ def test_retry_load() -> None:
     retry_count = 2
     with pytest.raises(PipelineStepFailed) as py_ex:
         for attempt in Retrying(
-            stop=stop_after_attempt(3), retry=retry_if_exception(retry_load(())), reraise=True
+            stop=stop_after_attempt(3),
+            wait=wait_none(),
+            retry=retry_if_exception(retry_load(())),
+            reraise=True,
         ):
             with attempt:
                 p.run(fail_extract())
     assert isinstance(py_ex.value, PipelineStepFailed)
     assert py_ex.value.step == "extract"
 
-    os.environ["COMPLETED_PROB"] = "0.0"
-    os.environ["RAISE_ON_FAILED_JOBS"] = "true"
-    os.environ["FAIL_PROB"] = "1.0"
+    monkeypatch.setenv("COMPLETED_PROB", "0.0")
+    monkeypatch.setenv("RAISE_ON_FAILED_JOBS", "true")
+    monkeypatch.setenv("FAIL_PROB", "1.0")
     with pytest.raises(PipelineStepFailed) as py_ex:
         for attempt in Retrying(
             stop=stop_after_attempt(3),
+            wait=wait_none(),
             retry=retry_if_exception(retry_load(("load", "extract"))),
             reraise=True,
         ):
@@ -780,10 +797,9 @@ def test_set_get_local_value() -> None:
     assert p.state["_local"][new_val] == new_val  # type: ignore[literal-required]
 
 
-def test_changed_write_disposition() -> None:
-    os.environ["COMPLETED_PROB"] = "1.0"
+def test_changed_write_disposition(dummy_complete: dummy) -> None:
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy_complete)
 
     @dlt.resource
     def resource_1():
@@ -818,29 +834,34 @@ def github_repo_events_table_meta(page):
     yield from [dlt.mark.with_table_name(p, p["type"]) for p in page]
 
 
+@lru_cache(maxsize=1)
+def _load_github_events() -> List[DictStrAny]:
+    # parse the case once, the resources below only read the events
+    # read bytes so the json backend (orjson) parses without decoding to str first
+    with open("tests/normalize/cases/github.events.load_page_1_duck.json", "rb") as f:
+        return json.loadb(f.read())
+
+
 @dlt.resource
 def _get_shuffled_events(repeat: int = 1):
     for _ in range(repeat):
-        with open(
-            "tests/normalize/cases/github.events.load_page_1_duck.json", "r", encoding="utf-8"
-        ) as f:
-            issues = json.load(f)
-            yield issues
+        yield _load_github_events()
 
 
 @pytest.mark.parametrize("github_resource", (github_repo_events_table_meta, github_repo_events))
-def test_dispatch_rows_to_tables(github_resource: DltResource):
-    os.environ["COMPLETED_PROB"] = "1.0"
+def test_dispatch_rows_to_tables(github_resource: DltResource, dummy_complete: dummy):
     pipeline_name = "pipe_" + uniq_id()
-    p = dlt.pipeline(pipeline_name=pipeline_name, destination="dummy")
+    p = dlt.pipeline(pipeline_name=pipeline_name, destination=dummy_complete)
 
     info = p.run(_get_shuffled_events | github_resource)
     assert_load_info(info)
 
     # get all expected tables
-    events = list(_get_shuffled_events)
     expected_tables = set(
-        map(lambda e: p.default_schema.naming.normalize_identifier(e["type"]), events)
+        map(
+            lambda e: p.default_schema.naming.normalize_identifier(e["type"]),
+            _load_github_events(),
+        )
     )
 
     # all the tables present
@@ -903,10 +924,7 @@ def test_preserve_fields_order() -> None:
         yield {"col_1": 1, "col_2": 2, "col_3": "list"}
 
     def reverse_order(item):
-        rev_dict = {}
-        for k in reversed(item.keys()):
-            rev_dict[k] = item[k]
-        return rev_dict
+        return dict(reversed(item.items()))
 
     p.extract(ordered_dict().add_map(reverse_order))
     p.normalize()
@@ -927,8 +945,8 @@ def test_preserve_fields_order() -> None:
     ]
 
 
-def test_pipeline_log_progress() -> None:
-    os.environ["TIMEOUT"] = "3.0"
+def test_pipeline_log_progress(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TIMEOUT", "3.0")
 
     # will attach dlt logger
     p = dlt.pipeline(
@@ -1092,9 +1110,7 @@ def test_emojis_resource_names() -> None:
     assert table["resource"] == "🦚WidePeacock"
 
 
-def test_apply_hints_infer_hints() -> None:
-    os.environ["COMPLETED_PROB"] = "1.0"
-
+def test_apply_hints_infer_hints(dummy_complete: dummy) -> None:
     @dlt.source
     def infer():
         yield dlt.resource(
@@ -1106,7 +1122,7 @@ def test_apply_hints_infer_hints() -> None:
     new_new_hints = {"not_null": ["timestamp"], "primary_key": ["id"]}
     s = infer()
     s.schema.merge_hints(new_new_hints)  # type: ignore[arg-type]
-    pipeline = dlt.pipeline(pipeline_name="inf", destination="dummy")
+    pipeline = dlt.pipeline(pipeline_name="inf", destination=dummy_complete)
     pipeline.run(s)
     # check schema
     table = pipeline.default_schema.get_table("table1")
@@ -1375,7 +1391,7 @@ def test_pipeline_list_packages() -> None:
     assert len(loaded_package.jobs["failed_jobs"]) == len(failed_jobs)
 
 
-def test_remove_pending_packages() -> None:
+def test_remove_pending_packages(monkeypatch: pytest.MonkeyPatch) -> None:
     pipeline = dlt.pipeline(pipeline_name="emojis", destination="dummy")
     pipeline.extract(airtable_emojis())
     assert pipeline.has_pending_data
@@ -1388,9 +1404,9 @@ def test_remove_pending_packages() -> None:
     pipeline.drop_pending_packages()
     assert pipeline.has_pending_data is False
     # partial load
-    os.environ["EXCEPTION_PROB"] = "1.0"
-    os.environ["FAIL_IN_INIT"] = "False"
-    os.environ["TIMEOUT"] = "1.0"
+    monkeypatch.setenv("EXCEPTION_PROB", "1.0")
+    monkeypatch.setenv("FAIL_IN_INIT", "False")
+    monkeypatch.setenv("TIMEOUT", "1.0")
     # should produce partial loads
     with pytest.raises(PipelineStepFailed):
         pipeline.run(airtable_emojis())
@@ -1402,27 +1418,24 @@ def test_remove_pending_packages() -> None:
 
 
 @pytest.mark.parametrize("workers", (1, 4), ids=("1 norm worker", "4 norm workers"))
-def test_parallel_pipelines_threads(workers: int) -> None:
+def test_parallel_pipelines_threads(workers: int, monkeypatch: pytest.MonkeyPatch) -> None:
     # critical section to control pipeline steps
     init_lock = threading.Lock()
-    extract_ev = threading.Event()
-    normalize_ev = threading.Event()
-    load_ev = threading.Event()
-    # control main thread
-    sem = threading.Semaphore(0)
+    # both pipelines and the main thread meet before each step
+    barrier = threading.Barrier(3)
 
     # rotate the files frequently so we have parallel normalize and load
-    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "10"
-    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    monkeypatch.setenv("DATA_WRITER__BUFFER_MAX_ITEMS", "10")
+    monkeypatch.setenv("DATA_WRITER__FILE_MAX_ITEMS", "10")
 
     # force spawn process pool
-    os.environ["NORMALIZE__START_METHOD"] = "spawn"
+    monkeypatch.setenv("NORMALIZE__START_METHOD", "spawn")
 
     page_repeats = 1
 
     # set the extra per pipeline
-    os.environ["PIPELINE_1__EXTRA"] = "CFG_P_1"
-    os.environ["PIPELINE_2__EXTRA"] = "CFG_P_2"
+    monkeypatch.setenv("PIPELINE_1__EXTRA", "CFG_P_1")
+    monkeypatch.setenv("PIPELINE_2__EXTRA", "CFG_P_2")
 
     def _run_pipeline(pipeline_name: str) -> Tuple[LoadInfo, PipelineContext, DictStrAny]:
         try:
@@ -1447,7 +1460,7 @@ def test_parallel_pipelines_threads(workers: int) -> None:
             def slow_func(items, extra):
                 # sdd configurable extra to each element
                 sleep(0.1)
-                return map(lambda item: {**item, **{"extra": extra}}, items)
+                return [{**item, "extra": extra} for item in items]
 
             @dlt.source
             def github(extra: str = dlt.config.value):
@@ -1463,22 +1476,18 @@ def test_parallel_pipelines_threads(workers: int) -> None:
             with init_lock:
                 pipeline = dlt.pipeline(pipeline_name=pipeline_name, destination="duckdb")
                 context = Container()[PipelineContext]
-        finally:
-            sem.release()
-        # start every step at the same moment to increase chances of any race conditions to happen
-        extract_ev.wait()
-        context_2 = Container()[PipelineContext]
-        try:
+            # start every step at the same moment to increase chances of any race conditions to happen
+            barrier.wait()
+            context_2 = Container()[PipelineContext]
             pipeline.extract(github())
-        finally:
-            sem.release()
-        normalize_ev.wait()
-        try:
+            barrier.wait()
             pipeline.normalize(workers=workers)
-        finally:
-            sem.release()
-        load_ev.wait()
-        info = pipeline.load()
+            barrier.wait()
+            info = pipeline.load()
+        except Exception:
+            # do not leave the other threads waiting for a failed pipeline
+            barrier.abort()
+            raise
 
         # get counts in the thread
         counts = load_data_table_counts(pipeline)
@@ -1490,27 +1499,16 @@ def test_parallel_pipelines_threads(workers: int) -> None:
         f_1 = pool.submit(_run_pipeline, "pipeline_1")
         f_2 = pool.submit(_run_pipeline, "pipeline_2")
 
-        sem.acquire()
-        sem.acquire()
-        if f_1.done():
-            raise f_1.exception()
-        if f_2.done():
-            raise f_2.exception()
-        extract_ev.set()
-        sem.acquire()
-        sem.acquire()
-        if f_1.done():
-            raise f_1.exception()
-        if f_2.done():
-            raise f_2.exception()
-        normalize_ev.set()
-        sem.acquire()
-        sem.acquire()
-        if f_1.done():
-            raise f_1.exception()
-        if f_2.done():
-            raise f_2.exception()
-        load_ev.set()
+        try:
+            # extract, normalize and load
+            for _ in range(3):
+                barrier.wait()
+        except threading.BrokenBarrierError:
+            # raise the exception of the pipeline that broke the barrier
+            for f in (f_1, f_2):
+                if not isinstance(f.exception(), threading.BrokenBarrierError):
+                    f.result()
+            raise
 
         info_1, context_1, counts_1 = f_1.result()
         info_2, context_2, counts_2 = f_2.result()
@@ -1545,8 +1543,8 @@ def test_parallel_pipelines_threads(workers: int) -> None:
 
 
 @pytest.mark.parametrize("workers", (1, 4), ids=("1 norm worker", "4 norm workers"))
-def test_parallel_pipelines_async(workers: int) -> None:
-    os.environ["NORMALIZE__WORKERS"] = str(workers)
+def test_parallel_pipelines_async(workers: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NORMALIZE__WORKERS", str(workers))
 
     # create both futures and thread parallel resources
 
@@ -1595,7 +1593,10 @@ def test_parallel_pipelines_async(workers: int) -> None:
     assert load_data_table_counts(pipeline_2) == {"defer_table": 5}
 
 
-def test_resource_while_stop() -> None:
+def test_resource_while_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+    # fetch as many pages concurrently as there are futures in flight (max_parallel_items)
+    monkeypatch.setenv("EXTRACT__WORKERS", "20")
+
     def product():
         stop = False
 
@@ -29,6 +29,9 @@ from dlt.common.utils import custom_environ, uniq_id
 from dlt.common.pipeline import PipelineContext, SupportsPipeline
 
 TEST_STORAGE_ROOT = "_storage"
+# give each pytest-xdist worker its own storage so workers do not wipe each other's files
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    TEST_STORAGE_ROOT += "_" + os.environ["PYTEST_XDIST_WORKER"]
 
 
 # destination constants